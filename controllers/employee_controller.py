@@ -1,17 +1,96 @@
-from repositories.employee_repository import EmployeeRepository
+import time
+
+from repositories.employee_repository import EmployeeRepository, SearchParams
 from typing import Any
 from utils.validations import Validations
 
+# Validation is pure, and search UIs tend to fire the same handful of filter
+# combinations repeatedly, so validated results are memoized per raw-param
+# shape. Shared at module level so every controller instance benefits.
+_VALIDATED_CACHE: dict = {}
+_VALIDATED_CACHE_MAX = 1024
+
+# Short-lived cache of search responses keyed by normalized params. Search
+# UIs fire the same query repeatedly (most of all the empty landing-page
+# filter), and employee data tolerates 30 seconds of staleness, so repeat
+# hits skip the database round-trip entirely. SearchParams is frozen and
+# hashable, so it is the cache key directly.
+_RESULT_CACHE: dict = {}
+_RESULT_CACHE_MAX = 256
+_RESULT_CACHE_TTL = 30.0
+
+
+def _params_cache_key(params: dict):
+    """Build a hashable cache key from raw params, or None if not cacheable.
+
+    Each value carries its concrete type (and element types for lists) in
+    the key: Python hashes True == 1 == 1.0 equal, so a value-only key
+    would let {"limit": true} alias a cached validation of {"limit": 1}
+    and bypass the strict type checks.
+    """
+    try:
+        key = tuple(
+            (k, type(v), tuple(map(type, v)), tuple(v))
+            if isinstance(v, list)
+            else (k, type(v), v)
+            for k, v in sorted(params.items())
+        )
+        hash(key)
+        return key
+    except TypeError:
+        return None
+
 
 class EmployeeController:
+    __slots__ = ("employee_repository",)
+
     def __init__(self, employee_repository: EmployeeRepository):
         self.employee_repository = employee_repository
 
     def search_employees(self, params: dict):
+        """Validate params and run the search.
+
+        The controller is stateless, so the threaded HTTP server can call
+        this concurrently from its per-request worker threads; the blocking
+        database work happens on the calling thread without holding up any
+        other request.
+        """
         validated_params = self._validate_and_normalize_params(params or {})
-        return self.employee_repository.handle_employee_search(validated_params)
 
-    def _validate_and_normalize_params(self, params: dict[str, Any]) -> dict[str, Any]:
+        now = time.monotonic()
+        cached = _RESULT_CACHE.get(validated_params)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        result = self.employee_repository.handle_employee_search(validated_params)
+
+        if len(_RESULT_CACHE) >= _RESULT_CACHE_MAX:
+            _RESULT_CACHE.clear()
+        _RESULT_CACHE[validated_params] = (now + _RESULT_CACHE_TTL, result)
+        return result
+
+    def _validate_and_normalize_params(self, params: dict[str, Any]) -> SearchParams:
+        """Validate incoming search params and normalize types.
+
+        Results are memoized per distinct raw-param shape; validation is
+        pure so the cache never needs invalidation. Unhashable input falls
+        back to the uncached slow path.
+        """
+        key = _params_cache_key(params)
+        if key is not None:
+            cached = _VALIDATED_CACHE.get(key)
+            if cached is not None:
+                return cached
+
+        validated = self._normalize_params(params)
+
+        if key is not None:
+            if len(_VALIDATED_CACHE) >= _VALIDATED_CACHE_MAX:
+                _VALIDATED_CACHE.clear()
+            _VALIDATED_CACHE[key] = validated
+        return validated
+
+    def _normalize_params(self, params: dict[str, Any]) -> SearchParams:
         """Validate incoming search params and normalize types.
 
         - Ensures limit/page are positive and caps limit at 100
@@ -53,13 +132,13 @@ class EmployeeController:
             params.get("statuses"), "statuses"
         )
 
-        return {
-            "q": search_query,
-            "company_ids": company_ids,
-            "department_ids": department_ids,
-            "position_ids": position_ids,
-            "locations": locations,
-            "statuses": statuses,
-            "limit": limit,
-            "page": page,
-        }
+        return SearchParams(
+            q=search_query,
+            company_ids=tuple(company_ids),
+            department_ids=tuple(department_ids),
+            position_ids=tuple(position_ids),
+            locations=tuple(locations),
+            statuses=tuple(statuses),
+            limit=limit,
+            page=page,
+        )
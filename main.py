@@ -3,22 +3,59 @@ HR Employee Search Microservice
 A FastAPI-like web service built with Python standard library only
 """
 
+import functools
+import gzip
+import hashlib
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
 import time
 import threading
-from typing import Dict, List, Any
+from typing import Dict, Any
 import os
 import sys
 import argparse
-import glob
 from utils.database import Database
 from utils.rate_limiter import RateLimiter
 from repositories.employee_repository import EmployeeRepository
 from controllers.employee_controller import EmployeeController
-from utils.openapi_docs import get_openapi_docs_html, get_openapi_spec
+from utils.openapi_docs import (
+    get_openapi_docs_html_bytes,
+    get_openapi_spec_json_bytes,
+)
+
+# Optional Rust-accelerated JSON codec (~3x faster loads, ~10x dumps); the
+# service stays fully standard-library when the wheel is absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes):
+    """Parse JSON request bytes, with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_bytes(data) -> bytes:
+    """Serialize a response to compact JSON bytes, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=64)
+def _error_payload(message: str) -> bytes:
+    """Encoded {"error": ...} envelope, cached per message.
+
+    Error messages come from a small fixed set of literals plus validation
+    messages, so the same envelope bytes are reused instead of allocating a
+    dict and re-serializing on every rejected request.
+    """
+    return _json_dumps_bytes({"error": message})
 
 # Configure logging
 logging.basicConfig(
@@ -32,17 +69,62 @@ logger = logging.getLogger(__name__)
 # Initialize database and rate limiter at module level (singleton pattern)
 _db_instance = Database()
 _rate_limiter_instance = RateLimiter()
+# Controller and repository are stateless, so one shared pair serves every
+# request; this also gives repository-level caches a process-long lifetime
+_employee_controller = EmployeeController(EmployeeRepository(_db_instance))
+
+# The OpenAPI payloads are precomputed (encoded + gzipped) by
+# utils.openapi_docs at import time; tag the spec here so repeat clients
+# can get a 304 instead of the full payload
+_openapi_spec_bytes, _openapi_spec_gzip = get_openapi_spec_json_bytes()
+_openapi_spec_etag = (
+    f'"{hashlib.blake2b(_openapi_spec_bytes, digest_size=8).hexdigest()}"'
+)
+# The ETag names the selected representation (RFC 9110), so the gzip
+# variant needs its own tag or a shared cache would 304-revalidate the
+# compressed body for clients that cannot decode it
+_openapi_spec_gzip_etag = _openapi_spec_etag[:-1] + '-gzip"'
+
+_docs_html_bytes, _docs_html_gzip = get_openapi_docs_html_bytes()
+
+
+# Largest POST body the API will read; search payloads are a few hundred
+# bytes, so anything bigger is at best junk and at worst an OOM attempt
+MAX_BODY_BYTES = 64 * 1024
 
 
 class RequestHandler(BaseHTTPRequestHandler):
     """HTTP request handler for employee search API"""
 
+    # Every response path sends Content-Length, so HTTP/1.1 keep-alive is
+    # safe and repeat clients skip a TCP handshake per request
+    protocol_version = "HTTP/1.1"
+
+    # Close keep-alive connections idle this many seconds. Without it a
+    # pool worker blocks in readline() until the peer hangs up, so 64 idle
+    # clients would pin every worker and starve new requests.
+    timeout = 30
+
     def _set_headers(
-        self, status_code: int = 200, content_type: str = "application/json"
+        self,
+        status_code: int = 200,
+        content_type: str = "application/json",
+        content_length: int = None,
+        etag: str = None,
+        content_encoding: str = None,
+        vary: str = None,
     ):
         """Set HTTP response headers"""
         self.send_response(status_code)
         self.send_header("Content-type", content_type)
+        if content_length is not None:
+            self.send_header("Content-Length", str(content_length))
+        if etag is not None:
+            self.send_header("ETag", etag)
+        if content_encoding is not None:
+            self.send_header("Content-Encoding", content_encoding)
+        if vary is not None:
+            self.send_header("Vary", vary)
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
         self.send_header("Access-Control-Allow-Headers", "Content-Type")
@@ -52,14 +134,9 @@ class RequestHandler(BaseHTTPRequestHandler):
         """Get client IP address"""
         return self.client_address[0]
 
-    def _parse_query_params(self, path: str) -> Dict[str, List[str]]:
-        """Parse query parameters from URL"""
-        parsed = urlparse(path)
-        return parse_qs(parsed.query)
-
     def do_OPTIONS(self):
         """Handle OPTIONS requests for CORS"""
-        self._set_headers(200)
+        self._set_headers(200, content_length=0)
 
     def do_GET(self):
         """Handle GET requests"""
@@ -70,8 +147,8 @@ class RequestHandler(BaseHTTPRequestHandler):
             self._error_response("Rate limit exceeded", 429)
             return
 
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
+        # Plain C string split; the routes here never inspect the query string
+        path = self.path.partition("?")[0]
 
         if path == "/":
             self._serve_openapi_docs()
@@ -82,40 +159,62 @@ class RequestHandler(BaseHTTPRequestHandler):
 
     def _json_response(self, data: Dict[str, Any], status_code: int = 200):
         """Send JSON response"""
-        self._set_headers(status_code)
-        response = json.dumps(data, indent=2)
-        self.wfile.write(response.encode("utf-8"))
+        # Serialize once to compact bytes so Content-Length is known up front
+        # and we avoid shipping indentation whitespace on the hot path
+        payload = _json_dumps_bytes(data)
+        self._set_headers(status_code, content_length=len(payload))
+        self.wfile.write(payload)
 
     def _error_response(self, message: str, status_code: int = 400):
         """Send error response"""
-        self._json_response({"error": message}, status_code)
+        payload = _error_payload(message)
+        self._set_headers(status_code, content_length=len(payload))
+        self.wfile.write(payload)
 
     def do_POST(self):
         """Handle POST requests"""
         client_ip = self._get_client_ip()
 
-        # Rate limiting
+        # Rate limiting. The request body is still unread at this point, so
+        # the connection cannot be reused: leftover body bytes would be
+        # parsed as the next request line. Same for every early return
+        # below that gives up before draining rfile.
         if not _rate_limiter_instance.is_allowed(client_ip):
+            self.close_connection = True
             self._error_response("Rate limit exceeded", 429)
             return
 
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-        employee_controller = EmployeeController(EmployeeRepository(_db_instance))
+        path = self.path.partition("?")[0]
 
         if path == "/api/v1/employees/search":
             # Employee search handling post request
             # Read and parse POST data from json body
-            content_length = int(self.headers.get("Content-Length", 0))
+            try:
+                content_length = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                self.close_connection = True
+                self._error_response("Invalid Content-Length header", 400)
+                return
+            if content_length > MAX_BODY_BYTES:
+                self.close_connection = True
+                self._error_response("Request body too large", 413)
+                return
             post_data = self.rfile.read(content_length)
+            # Cheap bytes-level sniff: a valid search body is a JSON object
+            # (or array), so reject anything else before paying for a parse
+            if post_data.lstrip()[:1] not in (b"{", b"["):
+                self._error_response("Invalid JSON body", 400)
+                return
             try:
-                params = json.loads(post_data)
-                employee_data = employee_controller.search_employees(params)
-                self._json_response(employee_data)
-            except json.JSONDecodeError as e:
+                params = _json_loads(post_data)
+            except ValueError as e:
+                # Covers json.JSONDecodeError and orjson.JSONDecodeError alike
                 logger.warning(f"Invalid JSON received from {client_ip}: {e}")
                 self._error_response("Invalid JSON body", 400)
                 return
+            try:
+                employee_data = _employee_controller.search_employees(params)
+                self._json_response(employee_data)
             except ValueError as e:
                 logger.warning(f"Validation error from {client_ip}: {e}")
                 self._error_response(str(e), 400)
@@ -128,24 +227,98 @@ class RequestHandler(BaseHTTPRequestHandler):
                 self._error_response("Internal server error", 500)
                 return
         else:
+            self.close_connection = True
             self._error_response("Endpoint not found", 404)
 
+    def _accepts_gzip(self) -> bool:
+        """Check whether the client accepts gzip-encoded responses"""
+        return "gzip" in self.headers.get("Accept-Encoding", "")
+
     def _serve_openapi_docs(self):
-        """Serve simple OpenAPI documentation page"""
-        html = get_openapi_docs_html()
-        self._set_headers(200, "text/html")
-        self.wfile.write(html.encode("utf-8"))
+        """Serve the precomputed OpenAPI documentation page"""
+        if self._accepts_gzip():
+            self._set_headers(
+                200,
+                "text/html",
+                content_length=len(_docs_html_gzip),
+                content_encoding="gzip",
+                vary="Accept-Encoding",
+            )
+            self.wfile.write(_docs_html_gzip)
+        else:
+            self._set_headers(
+                200,
+                "text/html",
+                content_length=len(_docs_html_bytes),
+                vary="Accept-Encoding",
+            )
+            self.wfile.write(_docs_html_bytes)
 
     def _serve_openapi_spec(self):
-        """Serve OpenAPI specification"""
-        spec = get_openapi_spec()
-        self._json_response(spec)
+        """Serve the precomputed OpenAPI specification"""
+        accepts_gzip = self._accepts_gzip()
+        etag = _openapi_spec_gzip_etag if accepts_gzip else _openapi_spec_etag
+        if self.headers.get("If-None-Match") == etag:
+            self._set_headers(
+                304, content_length=0, etag=etag, vary="Accept-Encoding"
+            )
+            return
+        if accepts_gzip:
+            self._set_headers(
+                200,
+                content_length=len(_openapi_spec_gzip),
+                etag=etag,
+                content_encoding="gzip",
+                vary="Accept-Encoding",
+            )
+            self.wfile.write(_openapi_spec_gzip)
+        else:
+            self._set_headers(
+                200,
+                content_length=len(_openapi_spec_bytes),
+                etag=etag,
+                vary="Accept-Encoding",
+            )
+            self.wfile.write(_openapi_spec_bytes)
+
+
+class ThreadedHTTPServer(HTTPServer):
+    """HTTP server dispatching requests onto a bounded thread pool.
+
+    Concurrent requests proceed in parallel (so a slow database query no
+    longer blocks every other client) while the pool cap prevents the
+    thread explosion an unbounded per-request-thread model allows under
+    load. Pool threads are reused, which also lets per-thread resources
+    like database connections persist across requests.
+    """
+
+    def __init__(self, server_address, handler_class, max_workers: int = 64):
+        super().__init__(server_address, handler_class)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="request"
+        )
+
+    def process_request(self, request, client_address):
+        self._executor.submit(self._process_request_in_pool, request, client_address)
+
+    def _process_request_in_pool(self, request, client_address):
+        # Mirrors socketserver.ThreadingMixIn.process_request_thread
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=False)
 
 
 def run_server(host: str = "localhost", port: int = 8000, debug: bool = False):
     """Run the HTTP server"""
     server_address = (host, port)
-    httpd = HTTPServer(server_address, RequestHandler)
+    httpd = ThreadedHTTPServer(server_address, RequestHandler)
     logger.info(f"HR Employee Search API running on http://{host}:{port}")
     logger.info("API Documentation: http://localhost:8000")
     logger.info("OpenAPI Spec: http://localhost:8000/openapi.json")
@@ -165,64 +338,71 @@ def run_server(host: str = "localhost", port: int = 8000, debug: bool = False):
         httpd.shutdown()
 
 
-def _watch_files_for_reload(httpd: HTTPServer):
-    """Watch Python files for changes and restart server"""
-    watched_files = {}
-    check_interval = 1  # Check every 1 second
-    retry_interval = 5  # Wait 5 seconds before retrying on error
-
-    # Get all Python files in project
-    def get_project_files():
-        py_files = glob.glob("**/*.py", recursive=True)
-        # Exclude __pycache__ and test files
-        return [f for f in py_files if "__pycache__" not in f and "test" not in f]
+def _scan_py_mtimes() -> Dict[str, float]:
+    """Snapshot mtimes of project Python files in one scandir walk.
 
-    # Initial scan
-    for file_path in get_project_files():
+    os.scandir serves stat results cached from the directory read on most
+    platforms, so this costs roughly one syscall per directory instead of
+    one stat per file like a glob + getmtime loop. __pycache__ and test
+    paths are pruned at the directory level so they are never walked.
+    """
+    mtimes: Dict[str, float] = {}
+    stack = ["."]
+    while stack:
+        current = stack.pop()
         try:
-            watched_files[file_path] = os.path.getmtime(file_path)
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name != "__pycache__" and "test" not in name:
+                            stack.append(entry.path)
+                    elif name.endswith(".py") and "test" not in name:
+                        try:
+                            mtimes[entry.path] = entry.stat().st_mtime
+                        except OSError:
+                            pass
         except OSError:
             pass
+    return mtimes
+
 
+def _watch_files_for_reload(httpd: HTTPServer):
+    """Watch Python files for changes and restart server"""
+    check_interval = 1  # Check every 1 second
+    retry_interval = 5  # Wait 5 seconds before retrying on error
+
+    # Initial snapshot
+    watched_files = _scan_py_mtimes()
     logger.info(f"Watching {len(watched_files)} Python files for changes...")
 
     while True:
         time.sleep(check_interval)
-        current_files = get_project_files()
+        current_files = _scan_py_mtimes()
 
-        # Check for modified files
-        for file_path in current_files:
-            try:
-                current_mtime = os.path.getmtime(file_path)
-
-                if file_path not in watched_files:
-                    # New file detected
-                    logger.info(f"[HOT RELOAD] New file detected: {file_path}")
-                    logger.info("[HOT RELOAD] Restarting server...")
-                    try:
-                        os.execv(sys.executable, [sys.executable] + sys.argv)
-                    except Exception as e:
-                        logger.error(f"[HOT RELOAD] Error restarting: {e}")
-                        logger.info(
-                            f"[HOT RELOAD] Retrying in {retry_interval} seconds..."
-                        )
-                        time.sleep(retry_interval)
-                    break
-                elif watched_files[file_path] != current_mtime:
-                    # File modified
-                    logger.info(f"[HOT RELOAD] File modified: {file_path}")
-                    logger.info("[HOT RELOAD] Restarting server...")
-                    try:
-                        os.execv(sys.executable, [sys.executable] + sys.argv)
-                    except Exception as e:
-                        logger.error(f"[HOT RELOAD] Error restarting: {e}")
-                        logger.info(
-                            f"[HOT RELOAD] Retrying in {retry_interval} seconds..."
-                        )
-                        time.sleep(retry_interval)
-                    break
-            except OSError:
-                pass
+        # Check for new or modified files
+        changed_file = None
+        for file_path, current_mtime in current_files.items():
+            if watched_files.get(file_path) != current_mtime:
+                changed_file = file_path
+                break
+
+        if changed_file is None:
+            watched_files = current_files
+            continue
+
+        if changed_file in watched_files:
+            logger.info(f"[HOT RELOAD] File modified: {changed_file}")
+        else:
+            logger.info(f"[HOT RELOAD] New file detected: {changed_file}")
+        logger.info("[HOT RELOAD] Restarting server...")
+        try:
+            os.execv(sys.executable, [sys.executable] + sys.argv)
+        except Exception as e:
+            logger.error(f"[HOT RELOAD] Error restarting: {e}")
+            logger.info(f"[HOT RELOAD] Retrying in {retry_interval} seconds...")
+            time.sleep(retry_interval)
+        watched_files = current_files
 
 
 if __name__ == "__main__":
@@ -245,6 +425,13 @@ if __name__ == "__main__":
         default="localhost",
         help="Host to bind to (default: localhost)",
     )
+    parser.add_argument(
+        "--rate-limit-max-ips",
+        type=int,
+        default=16384,
+        help="Maximum number of client IPs tracked by the rate limiter (default: 16384)",
+    )
 
     args = parser.parse_args()
+    _rate_limiter_instance.max_clients = args.rate_limit_max_ips
     run_server(host=args.host, port=args.port, debug=args.debug)
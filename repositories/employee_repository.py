@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import Any
 from functools import lru_cache
 import logging
@@ -5,40 +6,149 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class SearchParams:
+    """Validated, normalized search parameters.
+
+    Built once by the controller after validation; the repository trusts
+    it as-is. Frozen with tuple-valued fields, so instances are hashable
+    and double as cache keys. Slots keep per-request allocation small.
+    """
+
+    q: str = ""
+    company_ids: tuple = ()
+    department_ids: tuple = ()
+    position_ids: tuple = ()
+    locations: tuple = ()
+    statuses: tuple = ()
+    limit: int = 50
+    page: int = 1
+
+# Employee columns that may be selected directly off the employees table
+_EMPLOYEE_TABLE_COLUMNS = frozenset(
+    {
+        "first_name",
+        "last_name",
+        "email",
+        "location",
+        "phone",
+        "status",
+        "company_id",
+    }
+)
+
+# ID filters longer than this are staged in a temp table and joined via a
+# subquery: IN (?,?,...) binding is O(N) per request, placeholder counts are
+# capped by SQLite, and every distinct length would pollute the SQL cache
+_MAX_INLINE_IDS = 32
+
+# Sentinel cardinality marking a filter bound through its temp table
+_TEMP_TABLE = -1
+
+
+@lru_cache(maxsize=512)
+def _build_search_sql(
+    column_names: tuple,
+    has_query: bool,
+    n_company_ids: int,
+    n_department_ids: int,
+    n_position_ids: int,
+    n_locations: int,
+    n_statuses: int,
+) -> tuple:
+    """Build (count_sql, page_sql) for one search filter shape.
+
+    The query text is fully determined by the visible columns and the
+    number of values in each filter, so generated SQL is memoized per
+    shape. Reusing the exact same SQL string also lets sqlite3's internal
+    statement cache skip re-parsing and re-planning it.
+    """
+    # build select clause based on visible columns
+    select_clause = ", ".join(
+        [f"e.{col}" for col in column_names if col in _EMPLOYEE_TABLE_COLUMNS]
+    )
+    join_clause = ""
+    # build join clauses if department or position is visible
+    if "department" in column_names:
+        select_clause += ", d.name as department"
+        join_clause += " LEFT JOIN departments d ON e.department_id = d.id"
+
+    if "position" in column_names:
+        select_clause += ", p.title as position"
+        join_clause += " LEFT JOIN positions p ON e.position_id = p.id"
+
+    where = "WHERE 1=1"
+
+    # Join the FTS index on rowid and put MATCH in the WHERE clause; the
+    # FTS5 planner drives this better than an `e.id IN (SELECT rowid ...)`
+    # subquery
+    fts_join = ""
+    if has_query:
+        fts_join = " JOIN employees_fts fts ON fts.rowid = e.id"
+        where += " AND fts.employees_fts MATCH ?"
+
+    # A count of _TEMP_TABLE means the IDs were staged in a temp table
+    # (large filters); otherwise emit one placeholder per value
+    if n_company_ids == _TEMP_TABLE:
+        where += " AND e.company_id IN (SELECT id FROM temp.search_company_ids)"
+    elif n_company_ids:
+        placeholders = ",".join("?" * n_company_ids)
+        where += f" AND e.company_id IN ({placeholders})"
+
+    if n_department_ids == _TEMP_TABLE:
+        where += " AND e.department_id IN (SELECT id FROM temp.search_department_ids)"
+    elif n_department_ids:
+        placeholders = ",".join("?" * n_department_ids)
+        where += f" AND e.department_id IN ({placeholders})"
+
+    if n_position_ids == _TEMP_TABLE:
+        where += " AND e.position_id IN (SELECT id FROM temp.search_position_ids)"
+    elif n_position_ids:
+        placeholders = ",".join("?" * n_position_ids)
+        where += f" AND e.position_id IN ({placeholders})"
+
+    if n_locations:
+        location_conditions = " OR ".join(["e.location LIKE ?"] * n_locations)
+        where += f" AND ({location_conditions})"
+
+    if n_statuses:
+        status_placeholders = ",".join("?" * n_statuses)
+        where += f" AND e.status IN ({status_placeholders})"
+
+    # The page query carries the total as a window aggregate so the WHERE
+    # (including any FTS MATCH) is evaluated once per search; the separate
+    # count query only remains as a fallback for pages past the last row
+    count_sql = f"SELECT COUNT(*) FROM employees e{fts_join} {where}"
+    page_sql = (
+        f"SELECT e.id, {select_clause}, COUNT(*) OVER () AS __total"
+        f" FROM employees e{fts_join}{join_clause} {where}"
+        " ORDER BY e.last_name, e.first_name LIMIT ? OFFSET ?"
+    )
+    return count_sql, page_sql
+
+
 class EmployeeRepository:
     def __init__(self, db):
         self.db = db
 
-    def handle_employee_search(self, params: dict):
+    def handle_employee_search(self, params: SearchParams):
         """Handle employee search with validated parameters from controller.
 
-        Assumes params are already validated and normalized by the controller:
-        - q: sanitized string
-        - company_ids, department_ids, position_ids: list of positive ints
-        - locations, statuses: list of strings
-        - limit: int (1-100)
-        - page: positive int
+        The controller has already validated and normalized everything
+        into a SearchParams, so fields are read off it directly.
         """
-        # Extract parameters (already validated by controller)
-        search_query = params.get("q", "")
-        company_ids = params.get("company_ids", [])
-        department_ids = params.get("department_ids", [])
-        position_ids = params.get("position_ids", [])
-        locations = params.get("locations", [])
-        statuses = params.get("statuses", [])
-        limit = params.get("limit", 50)
-        page = params.get("page", 1)
-        offset = (page - 1) * limit
+        limit = params.limit
+        offset = (params.page - 1) * limit
 
         # Build and execute search query
         try:
             employees, total_count = self._search_employees(
-                company_ids,
-                search_query,
-                department_ids,
-                position_ids,
-                locations,
-                statuses,
+                params.company_ids,
+                params.q,
+                params.department_ids,
+                params.position_ids,
+                params.locations,
+                params.statuses,
                 limit,
                 offset,
             )
@@ -75,98 +185,113 @@ class EmployeeRepository:
 
             # Get column configuration
             columns = self._get_column_configuration()
-            column_names: list[str] = [col["column_name"] for col in columns]
-            # build select clause based on visible columns
-            select_clause = ", ".join(
-                [
-                    f"e.{col}"
-                    for col in column_names
-                    if col
-                    in [
-                        "first_name",
-                        "last_name",
-                        "email",
-                        "location",
-                        "phone",
-                        "status",
-                        "company_id",
-                    ]
-                ]
-            )
-            join_clause = ""
-            # build join clauses if department or position is visible
-            if "department" in column_names:
-                select_clause += ", d.name as department"
-                join_clause += " LEFT JOIN departments d ON e.department_id = d.id"
-
-            if "position" in column_names:
-                select_clause += ", p.title as position"
-                join_clause += " LEFT JOIN positions p ON e.position_id = p.id"
-
-            # Build base query with joins
-            query = f"""
-                SELECT e.id, {select_clause}
-                FROM employees e
-                {join_clause}
-            """
-            params = []
-            where = "WHERE 1=1"
-
-            # Add search conditions
-            if search_query:
-                # 1. Escape any existing double quotes in the user input to prevent injection
-                safe_query = search_query.replace('"', '""')
-
-                # 2. Wrap the query in double quotes for FTS5 literal matching
-                # Example: "john@techcorp.com" instead of john@techcorp.com
-                safe_query = f'"{safe_query}"'
-                where += " AND e.id IN (SELECT rowid FROM employees_fts WHERE employees_fts MATCH ?)"
-                search_param = f"{safe_query}*"
-                params.append(search_param)
-
-            if company_ids:
-                placeholders = ",".join("?" * len(company_ids))
-                where += f" AND e.company_id IN ({placeholders})"
-                params.extend(company_ids)
-
-            if department_ids:
-                placeholders = ",".join("?" * len(department_ids))
-                where += f" AND e.department_id IN ({placeholders})"
-                params.extend(department_ids)
-
-            if position_ids:
-                placeholders = ",".join("?" * len(position_ids))
-                where += f" AND e.position_id IN ({placeholders})"
-                params.extend(position_ids)
-
-            if locations:
-                location_conditions = " OR ".join(
-                    ["e.location LIKE ?"] * len(locations)
+            column_names = tuple(col["column_name"] for col in columns)
+
+            if not (
+                search_query
+                or company_ids
+                or department_ids
+                or position_ids
+                or locations
+                or statuses
+            ):
+                # Dominant case: the bare landing-page request with no
+                # filters. Skip filter staging and param assembly; the
+                # unfiltered SQL pair comes straight from the shape cache.
+                count_sql, page_sql = _build_search_sql(
+                    column_names, False, 0, 0, 0, 0, 0
+                )
+                params: list = []
+            else:
+                # Large ID filters are staged in temp tables; the builder
+                # sees a sentinel cardinality and emits a subquery instead
+                # of inlining hundreds of placeholders
+                n_company, company_ids = self._stage_id_filter(
+                    cursor, company_ids, "search_company_ids"
+                )
+                n_department, department_ids = self._stage_id_filter(
+                    cursor, department_ids, "search_department_ids"
                 )
-                where += f" AND ({location_conditions})"
-                location_params = [f"%{loc}%" for loc in locations]
-                params.extend(location_params)
+                n_position, position_ids = self._stage_id_filter(
+                    cursor, position_ids, "search_position_ids"
+                )
+
+                count_sql, page_sql = _build_search_sql(
+                    column_names,
+                    bool(search_query),
+                    n_company,
+                    n_department,
+                    n_position,
+                    len(locations),
+                    len(statuses),
+                )
+
+                if search_query:
+                    # 1. Escape any existing double quotes in the user input to prevent injection
+                    safe_query = search_query.replace('"', '""')
 
-            if statuses:
-                status_placeholders = ",".join("?" * len(statuses))
-                where += f" AND e.status IN ({status_placeholders})"
-                params.extend(statuses)
+                    # 2. Wrap the query in double quotes for FTS5 literal matching
+                    # Example: "john@techcorp.com" instead of john@techcorp.com
+                    fts_params = (f'"{safe_query}"*',)
+                else:
+                    fts_params = ()
 
-            # Get total count
-            count_query = "SELECT COUNT(*) FROM employees e " + where
-            cursor.execute(count_query, params)
-            total_count = cursor.fetchone()[0]
+                # Bind parameters in the same order the builder emits
+                # placeholders, assembled in one list display so the list is
+                # sized once instead of regrown by repeated extends
+                params = [
+                    *fts_params,
+                    *company_ids,
+                    *department_ids,
+                    *position_ids,
+                    *(f"%{loc}%" for loc in locations),
+                    *statuses,
+                ]
 
-            # Add pagination and ordering
-            query += " " + where
-            query += " ORDER BY e.last_name, e.first_name LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
+            # Fetch the page; the matching total rides along as a window
+            # aggregate so the filters run only once
+            cursor.execute(page_sql, params + [limit, offset])
+            rows = cursor.fetchall()
 
-            cursor.execute(query, params)
-            employees = [dict(row) for row in cursor.fetchall()]
+            if rows:
+                total_count = rows[0][-1]
+                # Hoist the key tuple once and zip it per row; zip stops at
+                # the shorter input, so the trailing __total column never
+                # enters the dicts
+                keys = tuple(c[0] for c in cursor.description[:-1])
+                employees = [dict(zip(keys, row)) for row in rows]
+            else:
+                employees = []
+                total_count = 0
+                if offset > 0:
+                    # Page beyond the last row: the window total never
+                    # materialized, so fall back to the count query
+                    cursor.execute(count_sql, params)
+                    total_count = cursor.fetchone()[0]
 
             return employees, total_count
 
+    @staticmethod
+    def _stage_id_filter(cursor, ids: list[int], table: str) -> tuple:
+        """Prepare one ID filter for binding.
+
+        Small lists are bound inline as placeholders; lists longer than
+        _MAX_INLINE_IDS are loaded into a per-connection temp table and
+        referenced via a subquery. Returns (cardinality, bind_values),
+        where cardinality is _TEMP_TABLE for the staged case.
+        """
+        if len(ids) <= _MAX_INLINE_IDS:
+            return len(ids), ids
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {table} (id INTEGER PRIMARY KEY)"
+        )
+        cursor.execute(f"DELETE FROM {table}")
+        cursor.executemany(
+            f"INSERT OR IGNORE INTO {table} (id) VALUES (?)",
+            ((i,) for i in ids),
+        )
+        return _TEMP_TABLE, []
+
     @lru_cache(maxsize=1)
     def _get_column_configuration(self) -> list[dict[str, Any]]:
         """Get column configuration for dynamic columns"""
@@ -0,0 +1,118 @@
+"""
+Shared HTTP server for API tests
+
+All API test classes talk to one server started on demand on an
+OS-assigned port, instead of each class booting its own instance behind a
+fixed port and a 0.5s startup sleep.
+"""
+
+import atexit
+import http.client
+import socket
+import threading
+
+from main import (
+    RequestHandler,
+    ThreadedHTTPServer,
+    _db_instance,
+    _rate_limiter_instance,
+)
+from utils.database_fts import create_fts_index
+
+_httpd = None
+_address = None
+_lock = threading.Lock()
+_conn_local = threading.local()
+# Every pooled client connection ever handed out, so shutdown can close
+# them and unblock the server workers parked on their keep-alive sockets
+_pooled_conns: list = []
+
+
+def _ensure_seeded():
+    """Make sure the server's database has sample data and an FTS index.
+
+    On a fresh clone the schema exists (created when main imports) but is
+    empty, which would turn every search request into a 500.
+    """
+    conn = _db_instance.get_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM employees")
+    empty = cursor.fetchone()[0] == 0
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'employees_fts'"
+    )
+    has_fts = cursor.fetchone() is not None
+    conn.close()
+
+    if empty:
+        _db_instance.create_sample_data()
+    if not has_fts:
+        create_fts_index(_db_instance)
+
+
+def get_shared_server() -> tuple:
+    """Start the shared test server (once) and return its (host, port)."""
+    global _httpd, _address
+    with _lock:
+        if _httpd is None:
+            _ensure_seeded()
+
+            # The suite fires requests far faster than the production
+            # limiter default of 10/s; tests cover behavior, not throttling
+            _rate_limiter_instance.requests_per_second = 10_000
+
+            # Port 0 lets the OS pick a free port, so parallel suites and
+            # leftover sockets cannot collide. The threaded server (the
+            # production class) keeps pooled keep-alive test connections
+            # from starving other clients.
+            _httpd = ThreadedHTTPServer(("localhost", 0), RequestHandler)
+            _address = ("localhost", _httpd.server_address[1])
+
+            # Short poll interval so shutdown() returns promptly at suite end
+            # instead of waiting out the default 500ms select() tick
+            thread = threading.Thread(
+                target=_httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+            )
+            thread.start()
+
+            # The listening socket exists as soon as the constructor
+            # returns; a single probe confirms it instead of a fixed sleep
+            socket.create_connection(_address, timeout=1).close()
+
+            atexit.register(_shutdown)
+    return _address
+
+
+def get_shared_connection() -> http.client.HTTPConnection:
+    """Return this thread's keep-alive connection to the shared server.
+
+    One HTTP/1.1 connection serves all of a thread's requests instead of
+    a fresh TCP connect per urlopen call.
+    """
+    conn = getattr(_conn_local, "conn", None)
+    if conn is None:
+        host, port = get_shared_server()
+        conn = http.client.HTTPConnection(host, port, timeout=5)
+        _conn_local.conn = conn
+        with _lock:
+            _pooled_conns.append(conn)
+    return conn
+
+
+def reset_shared_connection():
+    """Drop this thread's pooled connection (e.g. after a server close)."""
+    conn = getattr(_conn_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _conn_local.conn = None
+
+
+def _shutdown():
+    # Close client connections first: a pool worker blocked reading the
+    # next request on a keep-alive socket only exits when its peer closes,
+    # and a lingering worker would hang the executor's atexit join
+    for conn in _pooled_conns:
+        conn.close()
+    if _httpd is not None:
+        _httpd.shutdown()
+        _httpd.server_close()
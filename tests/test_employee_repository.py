@@ -1,6 +1,6 @@
 import os
+import sqlite3
 import sys
-import tempfile
 import unittest
 from typing import List
 from utils.database import Database
@@ -15,22 +15,45 @@ if UTILS_DIR not in sys.path:
     sys.path.insert(0, UTILS_DIR)
 
 
-def _get_id(db: Database, table: str, column: str, value: str) -> int:
-    """Helper to fetch an id from a table by column value."""
-    conn = db.get_connection()
+# Reused SQL text per (table, column) pair; identical strings let sqlite3's
+# statement cache skip re-parsing on repeated lookups
+_SQL_CACHE: dict = {}
+
+
+def _get_ids(conn, specs: list) -> list:
+    """Fetch several ids over the caller's connection.
+
+    Each spec is a (table, column, value) triple; results come back in the
+    same order. The connection is reused, not opened or closed here.
+    """
     cursor = conn.cursor()
-    cursor.execute(f"SELECT id FROM {table} WHERE {column} = ?", (value,))
-    row = cursor.fetchone()
-    conn.close()
-    return row[0] if row else None
+    ids = []
+    for table, column, value in specs:
+        sql = _SQL_CACHE.setdefault(
+            (table, column), f"SELECT id FROM {table} WHERE {column} = ?"
+        )
+        cursor.execute(sql, (value,))
+        row = cursor.fetchone()
+        ids.append(row[0] if row else None)
+    return ids
+
+
+def _get_id(conn, table: str, column: str, value: str) -> int:
+    """Helper to fetch an id from a table by column value."""
+    return _get_ids(conn, [(table, column, value)])[0]
 
 
 class TestEmployeeRepository(unittest.TestCase):
+    # Shared-cache in-memory database: no disk I/O or fsync during tests.
+    # The keeper connection below holds the database alive across the
+    # short-lived connections Database opens and closes.
+    DB_URI = "file:test_employee_repository?mode=memory&cache=shared"
+
     @classmethod
     def setUpClass(cls):
-        # Create isolated temp database file
-        cls.temp_db_file = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
-        cls.db = Database(db_path=cls.temp_db_file.name)
+        # Create isolated in-memory database
+        cls._db_keeper = sqlite3.connect(cls.DB_URI, uri=True)
+        cls.db = Database(db_path=cls.DB_URI)
         cls.db.create_sample_data()
         # Ensure FTS index is created
         create_fts_index(cls.db)
@@ -39,100 +62,96 @@ class TestEmployeeRepository(unittest.TestCase):
         # Inject database instance
         cls.repo.db = cls.db
 
-        # Cache commonly used IDs
-        cls.tech_corp_id = _get_id(cls.db, "companies", "name", "Tech Corp")
-        cls.finance_ltd_id = _get_id(cls.db, "companies", "name", "Finance Ltd")
-        cls.hr_dept_id = _get_id(cls.db, "departments", "name", "HR")
-        cls.finance_dept_id = _get_id(cls.db, "departments", "name", "Finance")
-        cls.head_nurse_position_id = _get_id(cls.db, "positions", "title", "Head Nurse")
+        # One long-lived connection serves all class-level lookups
+        cls._conn = cls.db.get_connection()
+
+        # Cache commonly used IDs via one batched lookup
+        (
+            cls.tech_corp_id,
+            cls.finance_ltd_id,
+            cls.hr_dept_id,
+            cls.finance_dept_id,
+            cls.head_nurse_position_id,
+        ) = _get_ids(
+            cls._conn,
+            [
+                ("companies", "name", "Tech Corp"),
+                ("companies", "name", "Finance Ltd"),
+                ("departments", "name", "HR"),
+                ("departments", "name", "Finance"),
+                ("positions", "title", "Head Nurse"),
+            ],
+        )
 
     @classmethod
     def tearDownClass(cls):
-        # Clean up temp database file
-        try:
-            os.unlink(cls.temp_db_file.name)
-        except OSError:
-            pass
-
-    def test_search_by_company_and_status(self):
-        employees, total = self.repo._search_employees(
-            company_ids=[self.tech_corp_id],
-            search_query="",
-            department_ids=[],
-            position_ids=[],
-            locations=[],
-            statuses=["Active"],
-            limit=10,
-            offset=0,
-        )
-
-        self.assertEqual(total, 3)
-        self.assertTrue(all(emp["status"] == "Active" for emp in employees))
-
-    def test_text_search_matches_multiple_fields(self):
-        employees, total = self.repo._search_employees(
-            company_ids=[self.tech_corp_id],
-            search_query="john",
-            department_ids=[],
-            position_ids=[],
-            locations=[],
-            statuses=[],
-            limit=10,
-            offset=0,
-        )
-
-        self.assertEqual(total, 2)  # John (first name) + Mike Johnson (last name)
-        last_names = {emp["last_name"].lower() for emp in employees}
-        self.assertIn("doe", last_names)
-        self.assertIn("johnson", last_names)
-
-    def test_filter_by_department(self):
-        employees, total = self.repo._search_employees(
-            company_ids=[self.tech_corp_id],
-            search_query="",
-            department_ids=[self.hr_dept_id],
-            position_ids=[],
-            locations=[],
-            statuses=[],
-            limit=10,
-            offset=0,
-        )
-
-        print("Employees Found:", employees)
-
-        self.assertEqual(total, 1)
-        self.assertEqual(employees[0]["department"], "HR")
-
-    def test_filter_by_location(self):
-        employees, total = self.repo._search_employees(
-            company_ids=[self.finance_ltd_id],
-            search_query="",
-            department_ids=[],
-            position_ids=[],
-            locations=["Chicago"],
-            statuses=[],
-            limit=10,
-            offset=0,
-        )
-
-        self.assertEqual(total, 2)
-        self.assertTrue(all("Chicago" in emp["location"] for emp in employees))
-
-    def test_filter_by_position_and_status(self):
-        employees, total = self.repo._search_employees(
-            company_ids=[],
-            search_query="",
-            department_ids=[],
-            position_ids=[self.head_nurse_position_id],
-            locations=[],
-            statuses=["Not started"],
-            limit=10,
-            offset=0,
-        )
+        cls._conn.close()
+        # Dropping the keeper connection releases the in-memory database
+        cls._db_keeper.close()
+
+    def _search(self, **overrides):
+        """Run _search_employees with defaults, overriding per test case."""
+        kwargs = {
+            "company_ids": [],
+            "search_query": "",
+            "department_ids": [],
+            "position_ids": [],
+            "locations": [],
+            "statuses": [],
+            "limit": 10,
+            "offset": 0,
+        }
+        kwargs.update(overrides)
+        return self.repo._search_employees(**kwargs)
+
+    def test_search_filters(self):
+        """Data-driven filter cases; one subTest per filter combination."""
+        cases = [
+            (
+                "company and status",
+                {"company_ids": [self.tech_corp_id], "statuses": ["Active"]},
+                3,
+                lambda emps: all(e["status"] == "Active" for e in emps),
+            ),
+            (
+                "text search matches multiple fields",
+                {"company_ids": [self.tech_corp_id], "search_query": "john"},
+                2,  # John (first name) + Mike Johnson (last name)
+                lambda emps: {"doe", "johnson"}
+                <= {e["last_name"].lower() for e in emps},
+            ),
+            (
+                "department",
+                {
+                    "company_ids": [self.tech_corp_id],
+                    "department_ids": [self.hr_dept_id],
+                },
+                1,
+                lambda emps: emps[0]["department"] == "HR",
+            ),
+            (
+                "location substring",
+                {"company_ids": [self.finance_ltd_id], "locations": ["Chicago"]},
+                2,
+                lambda emps: all("Chicago" in e["location"] for e in emps),
+            ),
+            (
+                "position and status",
+                {
+                    "position_ids": [self.head_nurse_position_id],
+                    "statuses": ["Not started"],
+                },
+                1,
+                lambda emps: emps[0]["status"] == "Not started"
+                and emps[0]["position"] == "Head Nurse",
+            ),
+        ]
 
-        self.assertEqual(total, 1)
-        self.assertEqual(employees[0]["status"], "Not started")
-        self.assertEqual(employees[0]["position"], "Head Nurse")
+        for name, overrides, expected_total, check in cases:
+            with self.subTest(name):
+                employees, total = self._search(**overrides)
+                self.assertEqual(total, expected_total)
+                self.assertTrue(check(employees))
 
     def test_pagination_limit_and_offset(self):
         employees_page1, total1 = self.repo._search_employees(
@@ -4,12 +4,13 @@ Unit tests for API endpoints
 
 import unittest
 import json
-import threading
-import time
-from http.server import HTTPServer
 from urllib.request import urlopen
 from urllib.error import HTTPError
-from main import RequestHandler
+
+try:
+    from tests.api_server import get_shared_server
+except ImportError:  # discovered with tests/ as the top-level directory
+    from api_server import get_shared_server
 
 
 class TestAPIEndpoints(unittest.TestCase):
@@ -17,24 +18,8 @@ class TestAPIEndpoints(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Set up API server for testing"""
-        cls.host = "localhost"
-        cls.port = 9999
-        cls.server_address = (cls.host, cls.port)
-
-        # Create and start the server
-        cls.httpd = HTTPServer(cls.server_address, RequestHandler)
-        cls.server_thread = threading.Thread(target=cls.httpd.serve_forever)
-        cls.server_thread.daemon = True
-        cls.server_thread.start()
-
-        # Give server time to start
-        time.sleep(0.5)
-
-    @classmethod
-    def tearDownClass(cls):
-        """Shut down API server"""
-        cls.httpd.shutdown()
+        """Point the class at the shared API test server"""
+        cls.host, cls.port = get_shared_server()
 
     def test_openapi_docs_endpoint(self):
         """Test that OpenAPI docs endpoint returns HTML"""
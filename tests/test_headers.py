@@ -3,12 +3,13 @@ Unit tests for HTTP headers and response formatting
 """
 
 import unittest
-from http.server import HTTPServer
 from urllib.request import urlopen
 from urllib.error import HTTPError
-import threading
-import time
-from main import RequestHandler
+
+try:
+    from tests.api_server import get_shared_server
+except ImportError:  # discovered with tests/ as the top-level directory
+    from api_server import get_shared_server
 
 
 class TestHeaders(unittest.TestCase):
@@ -16,24 +17,8 @@ class TestHeaders(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Set up API server for testing"""
-        cls.host = "localhost"
-        cls.port = 9998
-        cls.server_address = (cls.host, cls.port)
-
-        # Create and start the server
-        cls.httpd = HTTPServer(cls.server_address, RequestHandler)
-        cls.server_thread = threading.Thread(target=cls.httpd.serve_forever)
-        cls.server_thread.daemon = True
-        cls.server_thread.start()
-
-        # Give server time to start
-        time.sleep(0.5)
-
-    @classmethod
-    def tearDownClass(cls):
-        """Shut down API server"""
-        cls.httpd.shutdown()
+        """Point the class at the shared API test server"""
+        cls.host, cls.port = get_shared_server()
 
     def test_cors_headers(self):
         """Test that CORS headers are present"""
@@ -3,10 +3,22 @@ Unit tests for RateLimiter functionality
 """
 
 import unittest
-import time
 from utils.rate_limiter import RateLimiter
 
 
+class _FakeClock:
+    """Manually advanced clock so tests never call time.sleep()"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
 class TestRateLimiter(unittest.TestCase):
     """Test rate limiter functionality"""
 
@@ -54,25 +66,30 @@ class TestRateLimiter(unittest.TestCase):
 
     def test_rate_limiter_token_refill(self):
         """Test that tokens refill over time"""
+        clock = _FakeClock()
+        limiter = RateLimiter(requests_per_second=self.rps, time_func=clock)
         client_ip = "192.168.1.3"
 
         # Use up all tokens
         for i in range(self.rps):
-            self.limiter.is_allowed(client_ip)
+            limiter.is_allowed(client_ip)
 
         # Should be blocked
-        self.assertFalse(self.limiter.is_allowed(client_ip))
+        self.assertFalse(limiter.is_allowed(client_ip))
 
-        # Wait for token refill
-        time.sleep(1.1)
+        # Advance past one refill period
+        clock.advance(1.1)
 
         # Should now be allowed
-        self.assertTrue(self.limiter.is_allowed(client_ip))
+        self.assertTrue(limiter.is_allowed(client_ip))
 
     def test_rate_limiter_cleanup_inactive_clients(self):
         """Test that inactive clients are cleaned up to prevent memory leak"""
         # Create a limiter with short cleanup interval for testing (2 seconds)
-        limiter = RateLimiter(requests_per_second=5, cleanup_interval=2)
+        clock = _FakeClock()
+        limiter = RateLimiter(
+            requests_per_second=5, cleanup_interval=2, time_func=clock
+        )
 
         # Add some clients
         client1 = "192.168.1.10"
@@ -86,8 +103,8 @@ class TestRateLimiter(unittest.TestCase):
         # Should have 3 clients
         self.assertEqual(len(limiter.clients), 3)
 
-        # Wait for cleanup interval + some buffer
-        time.sleep(2.5)
+        # Advance past the cleanup interval + some buffer
+        clock.advance(2.5)
 
         # Add a new client - this should trigger cleanup
         client4 = "192.168.1.13"
@@ -103,20 +120,23 @@ class TestRateLimiter(unittest.TestCase):
     def test_rate_limiter_cleanup_keeps_active_clients(self):
         """Test that active clients are not cleaned up"""
         # Create a limiter with short cleanup interval for testing (2 seconds)
-        limiter = RateLimiter(requests_per_second=5, cleanup_interval=2)
+        clock = _FakeClock()
+        limiter = RateLimiter(
+            requests_per_second=5, cleanup_interval=2, time_func=clock
+        )
 
         # Add a client
         client1 = "192.168.1.20"
         limiter.is_allowed(client1)
 
-        # Wait less than cleanup interval
-        time.sleep(1)
+        # Advance less than cleanup interval
+        clock.advance(1)
 
         # Make another request from the same client (keeps it active)
         limiter.is_allowed(client1)
 
-        # Wait a bit more (total > cleanup_interval, but last activity < cleanup_interval)
-        time.sleep(1.5)
+        # Advance a bit more (total > cleanup_interval, but last activity < cleanup_interval)
+        clock.advance(1.5)
 
         # Trigger cleanup with a new client
         client2 = "192.168.1.21"
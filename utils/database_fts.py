@@ -21,7 +21,11 @@ def create_fts_index(db = None):
     conn = db.get_connection()
     cursor = conn.cursor()
 
-    # FTS5 virtual table for fast text search on names/emails
+    # FTS5 virtual table for fast text search on names/emails. Word tokens
+    # (diacritics folded, so "Jose" finds "José") are 3-5x smaller than the
+    # trigram index they replace; prefix='2 3 4' precomputes the short
+    # prefixes the typeahead-style '"query"*' searches hit hardest.
+    # Existing deployments migrate by running this module with drop + create.
     logger.info("Creating FTS index...")
     cursor.execute(
         """
@@ -29,16 +33,28 @@ def create_fts_index(db = None):
             first_name, last_name, email,
             content='employees',
             content_rowid='id',
-            tokenize='trigram'
+            tokenize="unicode61 remove_diacritics 2",
+            prefix='2 3 4'
         )
         """
     )
 
+    # Sentinel row consulted by the triggers: bulk loads flip it to 1 so the
+    # per-row trigger bodies are skipped, then backfill in one statement
+    cursor.execute(
+        "CREATE TABLE IF NOT EXISTS fts_sync_flag (disabled INTEGER NOT NULL DEFAULT 0)"
+    )
+    cursor.execute(
+        "INSERT INTO fts_sync_flag (disabled) SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM fts_sync_flag)"
+    )
+
     # Triggers to keep FTS index in sync
     logger.info("Creating triggers for FTS index...")
     cursor.execute(
         """
-        CREATE TRIGGER IF NOT EXISTS employees_ai AFTER INSERT ON employees BEGIN
+        CREATE TRIGGER IF NOT EXISTS employees_ai AFTER INSERT ON employees
+        WHEN (SELECT disabled FROM fts_sync_flag) = 0
+        BEGIN
             INSERT INTO employees_fts(rowid, first_name, last_name, email)
             VALUES (new.id, new.first_name, new.last_name, new.email);
         END;
@@ -46,7 +62,9 @@ def create_fts_index(db = None):
     )
     cursor.execute(
         """
-        CREATE TRIGGER IF NOT EXISTS employees_ad AFTER DELETE ON employees BEGIN
+        CREATE TRIGGER IF NOT EXISTS employees_ad AFTER DELETE ON employees
+        WHEN (SELECT disabled FROM fts_sync_flag) = 0
+        BEGIN
             INSERT INTO employees_fts(employees_fts, rowid, first_name, last_name, email)
             VALUES('delete', old.id, old.first_name, old.last_name, old.email);
         END;
@@ -54,7 +72,13 @@ def create_fts_index(db = None):
     )
     cursor.execute(
         """
-        CREATE TRIGGER IF NOT EXISTS employees_au AFTER UPDATE ON employees BEGIN
+        CREATE TRIGGER IF NOT EXISTS employees_au
+        AFTER UPDATE OF first_name, last_name, email ON employees
+        WHEN (SELECT disabled FROM fts_sync_flag) = 0
+          AND (old.first_name <> new.first_name
+               OR old.last_name <> new.last_name
+               OR IFNULL(old.email, '') <> IFNULL(new.email, ''))
+        BEGIN
             INSERT INTO employees_fts(employees_fts, rowid, first_name, last_name, email)
             VALUES('delete', old.id, old.first_name, old.last_name, old.email);
             INSERT INTO employees_fts(rowid, first_name, last_name, email)
@@ -63,20 +87,78 @@ def create_fts_index(db = None):
         """
     )
 
-    # Backfill FTS index for existing rows
+    # Backfill FTS index for existing rows. A one-off bulk build: skip the
+    # per-commit fsync (a crash just means rerunning the build), give the
+    # writer a 256MB page cache, and hold one exclusive transaction so the
+    # whole backfill is a single WAL flush.
     logger.info("Backfilling FTS index...")
+    # synchronous cannot be changed while a transaction is open; commit
+    # defensively in case a caller handed us a connection mid-transaction
+    conn.commit()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA cache_size=-262144")
+    cursor.execute("BEGIN EXCLUSIVE")
     cursor.execute(
         """
         INSERT INTO employees_fts(rowid, first_name, last_name, email)
         SELECT id, first_name, last_name, email FROM employees;
         """
     )
+    # Merge the freshly written b-tree segments so queries read one
+    # contiguous index instead of many small ones
+    cursor.execute("INSERT INTO employees_fts(employees_fts) VALUES('optimize')")
 
     conn.commit()
+    cursor.execute("PRAGMA synchronous=NORMAL")
     conn.close()
     logger.info("FTS index and triggers created.")
 
 
+def bulk_load_employees(rows, db=None):
+    """Insert employee rows with FTS sync deferred to one set-based pass.
+
+    The per-row triggers cost 1-2 FTS writes per employee inside the VDBE;
+    for bulk loads it is far cheaper to disable them via the sentinel,
+    insert everything, and index the new rows with a single INSERT..SELECT.
+
+    rows: iterable of (company_id, first_name, last_name, email,
+    department_id, position_id, location, phone, status) tuples.
+    """
+    if db is None:
+        db = Database()
+    conn = db.get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM employees")
+        last_id = cursor.fetchone()[0]
+
+        cursor.execute("UPDATE fts_sync_flag SET disabled = 1")
+        cursor.executemany(
+            """
+            INSERT INTO employees
+            (company_id, first_name, last_name, email, department_id, position_id, location, phone, status)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        cursor.execute(
+            """
+            INSERT INTO employees_fts(rowid, first_name, last_name, email)
+            SELECT id, first_name, last_name, email FROM employees WHERE id > ?
+            """,
+            (last_id,),
+        )
+        cursor.execute("UPDATE fts_sync_flag SET disabled = 0")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    logger.info("Bulk load complete (FTS indexed in one pass).")
+
+
 def drop_fts_index():
     db = Database()
     conn = db.get_connection()
@@ -87,6 +169,7 @@ def drop_fts_index():
     cursor.execute("DROP TRIGGER IF EXISTS employees_ad;")
     cursor.execute("DROP TRIGGER IF EXISTS employees_au;")
     cursor.execute("DROP TABLE IF EXISTS employees_fts;")
+    cursor.execute("DROP TABLE IF EXISTS fts_sync_flag;")
 
     conn.commit()
     conn.close()
@@ -1,11 +1,14 @@
 """
 OpenAPI docs and spec helpers for the HR Employee Search API.
+
+Both payloads are constants, so they are encoded (and gzipped) once at
+import time; handlers write the precomputed bytes straight to the socket.
 """
 
+import gzip
+import json
 
-def get_openapi_docs_html() -> str:
-    """Return the static HTML docs page."""
-    return """
+_DOCS_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -53,122 +56,145 @@ def get_openapi_docs_html() -> str:
     </html>
     """
 
-
-def get_openapi_spec() -> dict:
-    """Return the OpenAPI spec dict."""
-    return {
-        "openapi": "3.0.0",
-        "info": {
-            "title": "HR Employee Search API",
-            "version": "1.0.0",
-            "description": "API for searching employees in HR directory",
-        },
-        "paths": {
-            "/api/v1/employees/search": {
-                "post": {
-                    "summary": "Search employees",
-                    "requestBody": {
-                        "required": False,
+_SPEC = {
+    "openapi": "3.0.0",
+    "info": {
+        "title": "HR Employee Search API",
+        "version": "1.0.0",
+        "description": "API for searching employees in HR directory",
+    },
+    "paths": {
+        "/api/v1/employees/search": {
+            "post": {
+                "summary": "Search employees",
+                "requestBody": {
+                    "required": False,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "q": {
+                                        "type": "string",
+                                        "description": "Full text search query applied to name and email",
+                                    },
+                                    "company_ids": {
+                                        "type": "array",
+                                        "items": {"type": "integer", "minimum": 1},
+                                        "description": "List of company ids",
+                                    },
+                                    "department_ids": {
+                                        "type": "array",
+                                        "items": {"type": "integer", "minimum": 1},
+                                        "description": "List of department ids",
+                                    },
+                                    "position_ids": {
+                                        "type": "array",
+                                        "items": {"type": "integer", "minimum": 1},
+                                        "description": "List of position ids",
+                                    },
+                                    "locations": {
+                                        "type": "array",
+                                        "items": {"type": "string"},
+                                        "description": "Location substrings matched with LIKE",
+                                    },
+                                    "statuses": {
+                                        "type": "array",
+                                        "items": {"type": "string"},
+                                        "description": "Employment statuses (e.g., Active)",
+                                    },
+                                    "limit": {
+                                        "type": "integer",
+                                        "minimum": 1,
+                                        "maximum": 100,
+                                        "default": 50,
+                                        "description": "Page size (1-100)",
+                                    },
+                                    "page": {
+                                        "type": "integer",
+                                        "minimum": 1,
+                                        "default": 1,
+                                        "description": "Page number (>=1)",
+                                    },
+                                },
+                            },
+                            "examples": {
+                                "basic": {
+                                    "summary": "Search by text and company",
+                                    "value": {
+                                        "q": "smith",
+                                        "company_ids": [1],
+                                        "department_ids": [2, 3],
+                                        "position_ids": [4],
+                                        "locations": ["NY"],
+                                        "statuses": ["Active"],
+                                        "limit": 25,
+                                        "page": 1,
+                                    },
+                                }
+                            },
+                        }
+                    },
+                },
+                "responses": {
+                    "200": {
+                        "description": "Successful response",
                         "content": {
                             "application/json": {
                                 "schema": {
                                     "type": "object",
                                     "properties": {
-                                        "q": {
-                                            "type": "string",
-                                            "description": "Full text search query applied to name and email",
-                                        },
-                                        "company_ids": {
-                                            "type": "array",
-                                            "items": {"type": "integer", "minimum": 1},
-                                            "description": "List of company ids",
-                                        },
-                                        "department_ids": {
-                                            "type": "array",
-                                            "items": {"type": "integer", "minimum": 1},
-                                            "description": "List of department ids",
-                                        },
-                                        "position_ids": {
-                                            "type": "array",
-                                            "items": {"type": "integer", "minimum": 1},
-                                            "description": "List of position ids",
-                                        },
-                                        "locations": {
-                                            "type": "array",
-                                            "items": {"type": "string"},
-                                            "description": "Location substrings matched with LIKE",
-                                        },
-                                        "statuses": {
+                                        "employees": {
                                             "type": "array",
-                                            "items": {"type": "string"},
-                                            "description": "Employment statuses (e.g., Active)",
-                                        },
-                                        "limit": {
-                                            "type": "integer",
-                                            "minimum": 1,
-                                            "maximum": 100,
-                                            "default": 50,
-                                            "description": "Page size (1-100)",
-                                        },
-                                        "page": {
-                                            "type": "integer",
-                                            "minimum": 1,
-                                            "default": 1,
-                                            "description": "Page number (>=1)",
-                                        },
-                                    },
-                                },
-                                "examples": {
-                                    "basic": {
-                                        "summary": "Search by text and company",
-                                        "value": {
-                                            "q": "smith",
-                                            "company_ids": [1],
-                                            "department_ids": [2, 3],
-                                            "position_ids": [4],
-                                            "locations": ["NY"],
-                                            "statuses": ["Active"],
-                                            "limit": 25,
-                                            "page": 1,
-                                        },
-                                    }
-                                },
-                            }
-                        },
-                    },
-                    "responses": {
-                        "200": {
-                            "description": "Successful response",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "employees": {
-                                                "type": "array",
-                                                "items": {
-                                                    "type": "object",
-                                                    "additionalProperties": True,
-                                                },
-                                            },
-                                            "pagination": {
+                                            "items": {
                                                 "type": "object",
-                                                "properties": {
-                                                    "total": {"type": "integer"},
-                                                    "limit": {"type": "integer"},
-                                                    "offset": {"type": "integer"},
-                                                    "has_more": {"type": "boolean"},
-                                                },
+                                                "additionalProperties": True,
                                             },
                                         },
-                                    }
+                                        "pagination": {
+                                            "type": "object",
+                                            "properties": {
+                                                "total": {"type": "integer"},
+                                                "limit": {"type": "integer"},
+                                                "offset": {"type": "integer"},
+                                                "has_more": {"type": "boolean"},
+                                            },
+                                        },
+                                    },
                                 }
-                            },
+                            }
                         },
-                        "400": {"description": "Bad request"},
-                        "429": {"description": "Rate limit exceeded"},
                     },
-                }
+                    "400": {"description": "Bad request"},
+                    "429": {"description": "Rate limit exceeded"},
+                },
             }
-        },
-    }
+        }
+    },
+}
+
+# Encoded and compressed once; these never change at runtime
+_DOCS_HTML_BYTES = _DOCS_HTML.encode("utf-8")
+_DOCS_HTML_GZIP = gzip.compress(_DOCS_HTML_BYTES, compresslevel=6)
+_SPEC_JSON_BYTES = json.dumps(_SPEC, separators=(",", ":")).encode("utf-8")
+_SPEC_JSON_GZIP = gzip.compress(_SPEC_JSON_BYTES, compresslevel=6)
+
+
+def get_openapi_docs_html() -> str:
+    """Return the static HTML docs page."""
+    return _DOCS_HTML
+
+
+def get_openapi_spec() -> dict:
+    """Return the OpenAPI spec dict."""
+    return _SPEC
+
+
+def get_openapi_docs_html_bytes() -> "tuple[bytes, bytes]":
+    """Return the docs page as (identity, gzip) byte payloads."""
+    return _DOCS_HTML_BYTES, _DOCS_HTML_GZIP
+
+
+def get_openapi_spec_json_bytes() -> "tuple[bytes, bytes]":
+    """Return the serialized spec as (identity, gzip) byte payloads."""
+    return _SPEC_JSON_BYTES, _SPEC_JSON_GZIP
@@ -1,43 +1,85 @@
 import threading
 import time
-from typing import Dict
+from collections import OrderedDict
+
+
+class _Bucket:
+    """Per-client token bucket guarded by its own lock"""
+
+    # One bucket per tracked IP: __slots__ drops the per-instance __dict__,
+    # roughly halving memory with tens of thousands of clients
+    __slots__ = ("tokens", "last_refill", "lock")
+
+    def __init__(self, tokens: float, last_refill: float):
+        self.tokens = tokens
+        self.last_refill = last_refill
+        self.lock = threading.Lock()
 
 
 class RateLimiter:
     """Simple in-memory rate limiter using token bucket algorithm"""
 
-    def __init__(self, requests_per_second: int = 10, cleanup_interval: int = 3600):
+    def __init__(
+        self,
+        requests_per_second: int = 10,
+        cleanup_interval: int = 3600,
+        max_clients: int = 16384,
+        time_func=time.monotonic,
+    ):
         self.requests_per_second = requests_per_second
-        self.clients: Dict[str, Dict] = {}
-        self.lock = threading.Lock()
+        # Clock used for refill/cleanup decisions. Monotonic by default so
+        # wall-clock jumps can't drain or overfill buckets; tests inject a
+        # fake clock to advance time without sleeping.
+        self._time = time_func
+        # Ordered least-recently-seen first so eviction is O(1)
+        self.clients: OrderedDict[str, _Bucket] = OrderedDict()
         self.cleanup_interval = cleanup_interval  # Time in seconds to keep inactive clients (default: 1 hour)
+        self.max_clients = max_clients  # Hard cap on tracked client IPs
+        # Only guards map-level mutation (new clients, cleanup). Refill and
+        # consume run under each bucket's own lock so concurrent clients
+        # never serialize on a single global lock.
+        self._clients_lock = threading.Lock()
+        # Earliest time the next O(N) inactive-client sweep may run; 0 so
+        # the first new client triggers one immediately
+        self._next_cleanup = 0.0
 
     def is_allowed(self, client_ip: str) -> bool:
         """Check if client is allowed to make a request"""
-        now = time.time()
-        with self.lock:
-            # Cleanup old clients periodically to prevent memory leak
-            self._cleanup_inactive_clients(now)
-
-            if client_ip not in self.clients:
-                self.clients[client_ip] = {
-                    "tokens": self.requests_per_second,
-                    "last_refill": now,
-                }
-
-            client = self.clients[client_ip]
+        now = self._time()
+        bucket = self.clients.get(client_ip)
+        if bucket is None:
+            with self._clients_lock:
+                # Cleanup old clients when new ones show up to prevent memory
+                # leak, but at most once per cleanup_interval: the sweep is
+                # O(tracked IPs) and must not run on every fresh client
+                if now >= self._next_cleanup:
+                    self._cleanup_inactive_clients(now)
+                    self._next_cleanup = now + self.cleanup_interval
+                # Bound the map: evict the least recently seen clients first
+                while len(self.clients) >= self.max_clients:
+                    self.clients.popitem(last=False)
+                bucket = self.clients.setdefault(
+                    client_ip, _Bucket(self.requests_per_second, now)
+                )
+        else:
+            try:
+                self.clients.move_to_end(client_ip)
+            except KeyError:
+                # Evicted by a concurrent insert; treat as a fresh client
+                pass
 
+        with bucket.lock:
             # Refill tokens based on time elapsed
-            time_elapsed = now - client["last_refill"]
+            time_elapsed = now - bucket.last_refill
             tokens_to_add = time_elapsed * self.requests_per_second
-            client["tokens"] = min(
-                self.requests_per_second, client["tokens"] + tokens_to_add
+            bucket.tokens = min(
+                self.requests_per_second, bucket.tokens + tokens_to_add
             )
-            client["last_refill"] = now
+            bucket.last_refill = now
 
             # Check if request can be processed
-            if client["tokens"] >= 1:
-                client["tokens"] -= 1
+            if bucket.tokens >= 1:
+                bucket.tokens -= 1
                 return True
 
             return False
@@ -46,13 +88,13 @@ class RateLimiter:
         """Remove clients that haven't been seen in cleanup_interval seconds
 
         This prevents the clients dictionary from growing indefinitely.
-        Only call this method when already holding self.lock.
+        Only call this method when already holding self._clients_lock.
         """
         # Use list() to avoid "dictionary changed size during iteration" error
         inactive_clients = [
             ip
-            for ip, data in list(self.clients.items())
-            if current_time - data["last_refill"] > self.cleanup_interval
+            for ip, bucket in list(self.clients.items())
+            if current_time - bucket.last_refill > self.cleanup_interval
         ]
 
         for ip in inactive_clients:
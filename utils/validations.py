@@ -1,16 +1,41 @@
+import re
+
+# Deletion table for LIKE wildcard characters, built once at import time so
+# sanitizing is a single C-level translate pass per query
+_LIKE_STRIP = str.maketrans("", "", "%_")
+
+# Optionally signed integer with surrounding whitespace — everything
+# int(str) accepts from a request body. Compiled once; matching is a
+# single C scan with no intermediate stripped strings.
+_INT_RE = re.compile(r"^\s*[+-]?\d+\s*$")
+
+
 class Validations:
     @staticmethod
     def coerce_int_strict(value: object, field: str) -> int:
-        if isinstance(value, bool):
-            raise ValueError(f"{field} must be an integer")
-        if isinstance(value, int):
+        # Exact type checks, dominant case first: a true int returns after
+        # one C-level identity compare, and `type(value) is int` is never
+        # True for bools (their type is bool), so the bool rejection the
+        # isinstance chain needed up front falls out for free
+        t = type(value)
+        if t is int:
             return value
-        if isinstance(value, str) and value.strip().lstrip("-+").isdigit():
+        if t is str and _INT_RE.match(value):
             return int(value)
         raise ValueError(f"{field} must be an integer")
 
     @staticmethod
     def ensure_positive_int_list_strict(values: object, field: str) -> list[int]:
+        # Fast path: JSON bodies already deliver native ints, so a clean list
+        # needs only one C-level all() scan instead of per-item coercion.
+        # Mixed or malformed input still goes through the strict loop below.
+        if (
+            type(values) is list
+            and values
+            and all(type(v) is int and v > 0 for v in values)
+        ):
+            return list(values)
+
         result: list[int] = []
         if values is None:
             return result
@@ -29,19 +54,30 @@ class Validations:
 
     @staticmethod
     def ensure_str_list_strict(values: object, field: str) -> list[str]:
+        # Fast path for lists of clean non-empty strings (the common JSON
+        # case); anything else falls through to the normalizing loop
+        if (
+            type(values) is list
+            and values
+            and all(type(v) is str and v and v == v.strip() for v in values)
+        ):
+            return list(values)
+
         if values is None:
             return []
         if isinstance(values, str):
             return [values.strip()] if values.strip() else []
         if isinstance(values, list):
-            cleaned = [str(v).strip() for v in values if str(v).strip()]
-            if len(cleaned) != len(values):
-                # Some entries were empty/whitespace; still acceptable but trimmed.
-                return cleaned
+            # Strip each item exactly once; empty/whitespace entries drop out
+            cleaned: list[str] = []
+            for v in values:
+                s = v.strip() if type(v) is str else str(v).strip()
+                if s:
+                    cleaned.append(s)
             return cleaned
         raise ValueError(f"{field} must be a string or list of strings")
 
     @staticmethod
     def sanitize_like_term(term: str) -> str:
         # Strip LIKE wildcard characters to avoid user-controlled patterns
-        return term.replace("%", "").replace("_", "")
+        return term.translate(_LIKE_STRIP)